@@ -0,0 +1,210 @@
+"""
+Shared logic to generate the documentation for the options of the SAT solver.
+It parses the option declarations of a C++ header and renders a text manual.
+Entry-point scripts import parse_options and render_manual and decide where
+the manual goes.
+"""
+import heapq
+import re
+import sys
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Option:
+  category: str = ""
+  option: str = ""
+  alias: str = ""
+  type: str = ""
+  default: str = ""
+  description: str = ""
+  requires: str = ""
+  subsumed_by: str = ""
+  warning: str = ""
+
+
+# Columns rendered in the body of an option, in output order; the other
+# attributes all appear in the option's header line.
+printable_columns = ("description", "requires", "subsumed_by", "warning")
+
+# Labels used when a column is printed with an explicit prefix.
+column_to_label = {
+    "requires": "Requires",
+    "subsumed_by": "Subsumed by",
+    "warning": "Warning",
+}
+
+# The prefixes are constant across the run, so build them once.
+column_to_prefix = {column: label + ": " for column, label in column_to_label.items()}
+
+tag_to_attribute = {
+    "@brief": "description",
+    "@alias": "alias",
+    "@requires": "requires",
+    "@subsumed": "subsumed_by",
+}
+
+# Matches a declaration line such as "bool interactive = false;" and captures
+# the type, the option name and the (optional) default value in one scan.
+DECL_RE = re.compile(
+    r"(?P<type>bool|double|std::string)\s+"
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*"
+    r"(?:=\s*(?P<default>[^;]*?)\s*)?;")
+
+# Tags that were already reported; an unknown tag is only reported the first
+# time it is seen, not once per option using it.
+_warned_tags: set[str] = set()
+
+
+def parse_options(path):
+  """
+  Parses the option declarations and their documentation comments in the
+  header at path and returns them as a list of Option records.
+  """
+  options: list[Option] = []
+  current_category = ""
+  current_tag = ""
+  # fragments of the value of the current tag, joined once when flushed
+  current_tag_parts: list[str] = []
+
+  def flush_tag():
+    """
+    Stores the tag value accumulated so far in the last option record.
+    """
+    current_tag_value = " ".join(current_tag_parts)
+    if current_tag_value == "":
+      return
+    attribute = tag_to_attribute.get(current_tag)
+    if attribute is None:
+      if current_tag not in _warned_tags:
+        print("Warning: unknown tag \"" + current_tag + "\"", file=sys.stderr)
+        _warned_tags.add(current_tag)
+      return
+    setattr(options[-1], attribute, current_tag_value)
+
+  # Nothing before the first category marker is documentation; the file-level
+  # comment of the header would otherwise be parsed as an option.
+  document = False
+
+  with open(path, "r") as f:
+    # iterate the file object directly instead of materializing all lines
+    for line in f:
+      if not document:
+        # skip the preamble with a single containment test per line
+        if "/**" in line and "**/" in line:
+          current_category = line.split("/**", 1)[1].split("**/", 1)[0].strip()
+          document = True
+        continue
+      line = line.strip()
+      # Dispatch on the line prefix once; at most one branch runs per line and
+      # startswith stops at the first mismatched character instead of scanning
+      # the whole line like find.
+      if line.startswith("/**") and line.endswith("**/"):
+        current_category = line[3:-3].strip()
+        if current_category == "Stop Documentation":
+          break
+      elif line.startswith("/**"):
+        # start a new option record
+        options.append(Option())
+      elif line.startswith("*/"):
+        flush_tag()
+        current_tag = ""
+        current_tag_parts = []
+        # the next line should contain the name of the option
+      elif line.startswith("*"):
+        if line[1:].lstrip().startswith("@"):
+          flush_tag()
+          tag_text = line.split("@", 1)[1]
+          current_tag = "@" + tag_text.split(" ", 1)[0].strip()
+          current_tag_parts = [" ".join(tag_text.split()[1:])]
+        else:
+          current_tag_parts.append(line.split("*", 1)[1].strip())
+      else:
+        match = DECL_RE.match(line)
+        if match is not None:
+          option = options[-1]
+          option.type = "string" if match["type"] == "std::string" else match["type"]
+          option.option = "--" + match["name"].replace("_", "-")
+          default = match["default"]
+          if default is not None:
+            if option.type == "bool":
+              default = default.replace("true", "on").replace("false", "off")
+            option.default = default
+          option.category = current_category
+  return options
+
+
+def justify_to_length(line, length):
+  """
+  Ensures that the line has exactly length characters.
+  If a line is shorter than length, it is padded with between the longest words.
+  """
+  # collapse runs of whitespace into single spaces in one pass
+  line = " ".join(line.split())
+  words = line.split(" ")
+  if len(line) >= length:
+    print("Warning: line is too long to be justified")
+    return line
+  if len(words) < length - len(line) :
+    # the line is too short to be justified
+    return line
+  # pad after the longest words; ties are broken by position in the line
+  # do not count the last word, as it is not followed by a space
+  need = length - len(line)
+  widths = [(-len(word), index) for index, word in enumerate(words[:-1])]
+  padded = {index for _, index in heapq.nsmallest(need, widths)}
+  printed_line = []
+  for index, word in enumerate(words):
+    printed_line.append(word + ("  " if index in padded else " "))
+  # remove the last space
+  return "".join(printed_line)[:-1]
+
+
+def split_line_to_length(line, length, pad):
+  width = length - len(pad)
+  chunks = []
+  start = 0
+  n = len(line)
+  while n - start > width:
+    # find the last space before the length
+    last_space = line.rfind(" ", start, start + width)
+    if last_space == -1:
+      chunks.append(pad + line[start:start + width])
+      start += width
+    else:
+      chunks.append(pad + justify_to_length(line[start:last_space], width))
+      start = last_space + 1
+  chunks.append(pad + line[start:])
+  return "\n".join(chunks)
+
+
+def render_manual(options, max_length=80, tab_length=4):
+  """
+  Renders the manual for the given options and returns it as a single string.
+  """
+  out_parts = []
+  last_category = ""
+  # invariant across the whole run
+  pad = " " * tab_length
+  for option_line in options:
+    if option_line.category != last_category:
+      category_string = (" " + option_line.category + " ").center(max_length, "*")
+      last_category = option_line.category
+      out_parts.append(category_string + "\n")
+    # print the name of the option. If there is an alias, print it as well
+    option_string = "  "
+    if option_line.alias != "":
+      option_string += option_line.alias + " or "
+    option_string += option_line.option
+    if option_line.type != "":
+      option_string += " <" + option_line.type + " = " + option_line.default + ">"
+    option_string += "\n"
+
+    for column in printable_columns:
+      value = getattr(option_line, column)
+      if value != "":
+        if (column != "description"):
+          value = column_to_prefix[column] + value
+        option_string += split_line_to_length(value, max_length, pad) + "\n"
+    out_parts.append(option_string + "\n")
+  return "".join(out_parts)